@@ -27,7 +27,9 @@ def read(fname):
     Utility function to read the README file.
     :rtype : String
     """
-    return open(os.path.join(os.path.dirname(__file__), fname)).read()
+    path = os.path.join(os.path.dirname(__file__), fname)
+    with open(path, encoding="utf-8") as f:
+        return f.read()
 
 
 version = '0.4.1.dev0'
@@ -26,7 +26,14 @@
 
 import sys
 
+import omero.cmd
 from omero.cli import CLI, GraphControl
+from omero_ext.argparse import Action
+
+_DoAll = omero.cmd.DoAll
+_SkipHead = omero.cmd.SkipHead
+_DoAllRsp = omero.cmd.DoAllRsp
+_DuplicateResponse = omero.cmd.DuplicateResponse
 
 HELP = ("""Duplicate graphs of OMERO data based on the ID of the top-node.
 
@@ -71,10 +78,21 @@ ignored directly because they have no separate link class.
 """)
 
 
+class _CSVAppend(Action):
+    """
+    Collect comma-separated class names from repeated options
+    into a single flat tuple, dropping repeats but keeping order.
+    """
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        items = list(getattr(namespace, self.dest, None) or ())
+        items.extend(v for s in values for v in s.split(","))
+        setattr(namespace, self.dest, tuple(dict.fromkeys(items)))
+
+
 class DuplicateControl(GraphControl):
 
     def cmd_type(self):
-        import omero
         import omero.all
         return omero.cmd.Duplicate
 
@@ -83,54 +101,53 @@ class DuplicateControl(GraphControl):
             "--duplicate",
             help="Specify kinds of object to duplicate",
             metavar="CLASS",
-            nargs="+", type=lambda s: s.split(","), action="append")
+            nargs="+", action=_CSVAppend)
         parser.add_argument(
             "--reference",
             help=("Specify kinds of object to "
                   "link to instead of duplicate"),
             metavar="CLASS",
-            nargs="+", type=lambda s: s.split(","), action="append")
+            nargs="+", action=_CSVAppend)
         parser.add_argument(
             "--ignore",
             help=("Specify kinds of object to "
                   "ignore, neither linking to nor duplicating"),
             metavar="CLASS",
-            nargs="+", type=lambda s: s.split(","), action="append")
+            nargs="+", action=_CSVAppend)
 
     def _process_request(self, req, args, client):
-        import omero.cmd
-        if isinstance(req, omero.cmd.DoAll):
+        if type(req) is _DoAll:
             requests = req.requests
         else:
             requests = [req]
-        for request in requests:
-            from itertools import chain
-            if isinstance(request, omero.cmd.SkipHead):
-                request = request.request
-            if args.duplicate:
-                request.typesToDuplicate = list(chain(*chain(*args.duplicate)))
-            if args.reference:
-                request.typesToReference = list(chain(*chain(*args.reference)))
-            if args.ignore:
-                request.typesToIgnore = list(chain(*chain(*args.ignore)))
+        assigns = [(name, types) for name, types in (
+            ("typesToDuplicate", args.duplicate),
+            ("typesToReference", args.reference),
+            ("typesToIgnore", args.ignore)) if types]
+        if assigns:
+            for request in requests:
+                if type(request) is _SkipHead:
+                    request = request.request
+                for name, types in assigns:
+                    setattr(request, name, types)
 
         super(DuplicateControl, self)._process_request(req, args, client)
 
     def print_detailed_report(self, req, rsp, status):
-        import omero
-        if isinstance(rsp, omero.cmd.DoAllRsp):
+        rsp_type = type(rsp)
+        if rsp_type is _DoAllRsp:
+            pdr = self.print_duplicate_response
             for response in rsp.responses:
-                if isinstance(response, omero.cmd.DuplicateResponse):
-                    self.print_duplicate_response(response)
-        elif isinstance(rsp, omero.cmd.DuplicateResponse):
+                if type(response) is _DuplicateResponse:
+                    pdr(response)
+        elif rsp_type is _DuplicateResponse:
             self.print_duplicate_response(rsp)
 
     def print_duplicate_response(self, rsp):
         if rsp.duplicates:
-            self.ctx.out("Duplicates")
             obj_ids = self._get_object_ids(rsp.duplicates)
-            for k in obj_ids:
-                self.ctx.out("  %s:%s" % (k, obj_ids[k]))
+            self.ctx.out("Duplicates\n" + "\n".join(
+                f"  {k}:{v}" for k, v in obj_ids.items()))
 
 
 try:
@@ -20,12 +20,40 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
 import omero
+from omero.cli import GraphControl
 from omero.plugins.duplicate import DuplicateControl
+from omero_ext.argparse import ArgumentParser
 from cli import CLITest
 import pytest
 
 object_types = ["Image", "Dataset", "Project", "Plate", "Screen"]
 model = ["", "I"]
+class_options = ["duplicate", "reference", "ignore"]
+class_values = [
+    ([], None),
+    (["A"], ("A",)),
+    (["A,B", "C"], ("A", "B", "C")),
+    (["A", "A,B", "B,C"], ("A", "B", "C")),
+]
+
+
+@pytest.mark.parametrize("values,expected", class_values)
+@pytest.mark.parametrize("option", class_options)
+def test_class_option_parsing(option, values, expected):
+    parser = ArgumentParser()
+    DuplicateControl()._pre_objects(parser)
+    # Pass the last of several values through a repeated flag
+    argv = []
+    if len(values) > 1:
+        argv += ["--%s" % option] + values[:-1]
+        argv += ["--%s" % option, values[-1]]
+    elif values:
+        argv += ["--%s" % option] + values
+    args = parser.parse_args(argv)
+    assert getattr(args, option) == expected
+    for other in class_options:
+        if other != option:
+            assert getattr(args, other) is None
 
 
 class TestDuplicate(CLITest):
@@ -39,6 +67,19 @@ class TestDuplicate(CLITest):
         self.cli.invoke(self.args, strict=True)
         return capfd.readouterr()[0]
 
+    def capture_requests(self, monkeypatch):
+        """Record each request DuplicateControl passes on for execution"""
+
+        requests = []
+        process_request = GraphControl._process_request
+
+        def capture(control, req, args, client):
+            requests.append(req)
+            process_request(control, req, args, client)
+
+        monkeypatch.setattr(GraphControl, "_process_request", capture)
+        return requests
+
     def get_dataset(self, iid):
         """Retrieve all the parent datasets linked to the image"""
 
@@ -258,3 +299,60 @@ class TestDuplicate(CLITest):
 
         # Check the Project has not been duplicated
         assert len(objsp) == 1
+
+    def test_repeated_class_names_sent_once(self, monkeypatch, capfd):
+        oid = self.create_object("Dataset", name=self.uuid())
+        requests = self.capture_requests(monkeypatch)
+
+        self.args += ['Dataset:%s' % oid, '--dry-run']
+        self.args += ['--duplicate', 'CommentAnnotation']
+        self.args += ['--duplicate', 'CommentAnnotation,LongAnnotation']
+        self.duplicate(capfd)
+
+        # Check the single request lists each class name once, in order
+        assert len(requests) == 1
+        assert requests[0].typesToDuplicate == (
+            "CommentAnnotation", "LongAnnotation")
+
+    def test_skiphead_doall_ignore(self, monkeypatch, capfd):
+        requests = self.capture_requests(monkeypatch)
+        names = []
+        args = []
+        for i in range(2):
+            named = self.uuid()
+            namei = self.uuid()
+            proj = self.make_project(self.uuid())
+            dset = self.make_dataset(named)
+            img = self.make_image(namei)
+            self.link(proj, dset)
+            self.link(dset, img)
+            names.append((named, img.id.val))
+            args.append('Project/Dataset:%s' % proj.id.val)
+
+        self.args += args
+        self.args += ['--ordered', '--ignore', 'DatasetImageLink']
+        self.duplicate(capfd)
+
+        # Check the option reached the request inside each SkipHead
+        assert len(requests) == 1
+        assert type(requests[0]) is omero.cmd.DoAll
+        assert len(requests[0].requests) == 2
+        for r in requests[0].requests:
+            assert type(r) is omero.cmd.SkipHead
+            assert r.request.typesToIgnore == ("DatasetImageLink",)
+
+        for named, iid in names:
+            pd = omero.sys.ParametersI()
+            pd.addString("name", named)
+            query = "select obj from Dataset obj where obj.name=:name"
+            objsd = self.query.findAllByQuery(query, pd)
+
+            # Check each Dataset has been duplicated
+            assert len(objsd) == 2
+            assert objsd[0].id.val != objsd[1].id.val
+
+            # Check the Image is linked to just the original Dataset
+            dat_linked = self.get_dataset(iid)
+            assert len(dat_linked) == 1
+            assert dat_linked[0].id.val == min(
+                objsd[0].id.val, objsd[1].id.val)